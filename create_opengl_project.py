@@ -5,634 +5,733 @@ create_opengl_project.py
 Generate a ready-to-build OpenGL starter project (GLFW + GLAD + GLM + Dear ImGui)
 using CMake and modern C++.
 """
+from __future__ import annotations
+
 import argparse
-import re
+import functools
+import os
 import sys
 import textwrap
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from string import Template, ascii_letters, digits
+
+
+class _SlugTable(dict):
+    # Anything that is not an ASCII letter or digit becomes a separator.
+    def __missing__(self, key: int) -> str:
+        return "_"
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c.lower() for c in ascii_letters + digits})
 
 
 def slugify(name: str) -> str:
-    slug = re.sub(r"[^a-z0-9]+", "_", name.strip().lower()).strip("_")
+    slug = "_".join(filter(None, name.lower().translate(_SLUG_TABLE).split("_")))
     if not slug:
         raise ValueError("Project name must contain at least one alphanumeric character.")
     return slug
 
 
-def safe_write(path: Path, contents: str, force: bool) -> None:
-    if path.exists() and not force:
-        raise FileExistsError(f"{path} already exists. Use --force to overwrite.")
-    path.write_text(contents, encoding="utf-8")
-
-
-def build_cmakelists(project_name: str) -> str:
-    return textwrap.dedent(
-        f"""\
-        cmake_minimum_required(VERSION 3.21)
-
-        project({project_name} VERSION 0.1.0 LANGUAGES CXX)
-
-        set(CMAKE_CXX_STANDARD 20)
-        set(CMAKE_CXX_STANDARD_REQUIRED ON)
-        set(CMAKE_EXPORT_COMPILE_COMMANDS ON)
-
-        include(FetchContent)
-
-        if(POLICY CMP0169)
-            cmake_policy(SET CMP0169 OLD)
-        endif()
-
-        set(GLFW_BUILD_DOCS OFF CACHE INTERNAL "")
-        set(GLFW_BUILD_TESTS OFF CACHE INTERNAL "")
-        set(GLFW_BUILD_EXAMPLES OFF CACHE INTERNAL "")
-        set(GLFW_INSTALL OFF CACHE INTERNAL "")
-
-        FetchContent_Declare(
-            glfw
-            GIT_REPOSITORY https://github.com/glfw/glfw.git
-            GIT_TAG 3.4
-        )
-
-        FetchContent_Declare(
-            glm
-            GIT_REPOSITORY https://github.com/g-truc/glm.git
-            GIT_TAG 1.0.1
-        )
-        set(GLM_TEST_ENABLE OFF CACHE INTERNAL "")
-
-        FetchContent_Declare(
-            glad
-            GIT_REPOSITORY https://github.com/Dav1dde/glad.git
-            GIT_TAG v0.1.36
-            PATCH_COMMAND ${{CMAKE_COMMAND}} -DGLAD_SOURCE=<SOURCE_DIR> -P ${{CMAKE_CURRENT_LIST_DIR}}/cmake/patch_glad.cmake
-        )
-
-        set(GLAD_PROFILE \"core\" CACHE STRING \"\" FORCE)
-        set(GLAD_API \"gl=4.1\" CACHE STRING \"\" FORCE)
-        set(GLAD_GENERATOR \"c\" CACHE STRING \"\" FORCE)
-        set(GLAD_EXTENSIONS \"\" CACHE STRING \"\" FORCE)
-
-        FetchContent_Declare(
-            imgui
-            GIT_REPOSITORY https://github.com/ocornut/imgui.git
-            GIT_TAG v1.90.4
-        )
-
-        FetchContent_MakeAvailable(glfw glm glad)
-
-        FetchContent_GetProperties(imgui)
-        if(NOT imgui_POPULATED)
-            FetchContent_Populate(imgui)
-        endif()
-
-        set(IMGUI_SOURCES
-            ${{imgui_SOURCE_DIR}}/imgui.cpp
-            ${{imgui_SOURCE_DIR}}/imgui_demo.cpp
-            ${{imgui_SOURCE_DIR}}/imgui_draw.cpp
-            ${{imgui_SOURCE_DIR}}/imgui_tables.cpp
-            ${{imgui_SOURCE_DIR}}/imgui_widgets.cpp
-            ${{imgui_SOURCE_DIR}}/backends/imgui_impl_glfw.cpp
-            ${{imgui_SOURCE_DIR}}/backends/imgui_impl_opengl3.cpp
-        )
-
-        add_library(imgui_backend STATIC ${{IMGUI_SOURCES}})
-        target_include_directories(imgui_backend PUBLIC
-            ${{imgui_SOURCE_DIR}}
-            ${{imgui_SOURCE_DIR}}/backends
-        )
-        target_link_libraries(imgui_backend PUBLIC glfw glad)
-        target_compile_definitions(imgui_backend PUBLIC IMGUI_DISABLE_OBSOLETE_FUNCTIONS)
-        
-        file(GLOB_RECURSE SRC_FILES CONFIGURE_DEPENDS
-            "${CMAKE_SOURCE_DIR}/src/*.cpp"
-            "${CMAKE_SOURCE_DIR}/src/*.c"
-        )
-
-        add_executable(${PROJECT_NAME} ${SRC_FILES})
-
-        target_include_directories(${{PROJECT_NAME}} PRIVATE src)
-        target_link_libraries(${{PROJECT_NAME}} PRIVATE glfw glad imgui_backend glm::glm)
-        target_compile_definitions(${{PROJECT_NAME}} PRIVATE IMGUI_IMPL_OPENGL_LOADER_GLAD)
-
-        if (APPLE)
-            target_link_libraries(${{PROJECT_NAME}} PRIVATE "-framework Cocoa" "-framework IOKit" "-framework CoreVideo")
-        endif()
-        """
-    ).strip() + "\n"
-
-
-def build_main_cpp(display_name: str) -> str:
-    return textwrap.dedent(
-        f"""\
-        #include "Application.hpp"
-
-        #include <cstdio>
-        #include <cstdlib>
-        #include <exception>
-
-        int main() {{
-            try {{
-                Application app("{display_name}", 1280, 720);
-                app.Run();
-            }} catch (const std::exception& e) {{
-                std::fprintf(stderr, "Fatal error: %s\\n", e.what());
-                return EXIT_FAILURE;
-            }}
-            return EXIT_SUCCESS;
-        }}
-        """
-    ).strip() + "\n"
-
-
-def build_application_hpp() -> str:
-    return textwrap.dedent(
-        """\
-        #pragma once
-
-        #include <string>
-
-        struct GLFWwindow;
-
-        class Application {
-        public:
-            Application(std::string title, int width, int height);
-            ~Application();
-
-            Application(const Application&) = delete;
-            Application& operator=(const Application&) = delete;
-
-            void Run();
-
-        private: // Methods
-            void Initialize();
-            void Shutdown();
-            void OnFramebufferResized(int width, int height);
-            void OnContentScaleChanged(float xScale, float yScale);
-
-        private: // Members
-            std::string m_Title;
-            int m_Width;
-            int m_Height;
-            GLFWwindow* m_Window{nullptr};
-            bool m_GlfwInitialized{false};
-            bool m_ImguiInitialized{false};
-            int m_FramebufferWidth{0};
-            int m_FramebufferHeight{0};
-            float m_ContentScaleX{1.0f};
-            float m_ContentScaleY{1.0f};
-        };
-        """
-    ).strip() + "\n"
-
-
-def build_application_cpp() -> str:
-    return textwrap.dedent(
-        """\
-        #include "Application.hpp"
-
-        #include <stdexcept>
-        #include <utility>
-
-        #ifndef GLFW_INCLUDE_NONE
-        #define GLFW_INCLUDE_NONE
-        #endif
-        #include <GLFW/glfw3.h>
-        #include <glad/glad.h>
-
-        #include <imgui.h>
-        #include <imgui_impl_glfw.h>
-        #include <imgui_impl_opengl3.h>
-
-        #include <glm/glm.hpp>
-        #include <glm/gtc/type_ptr.hpp>
-
-        #include <cstdio>
-
-        namespace {
-        void glfw_error_callback(int error, const char* description) {
-            std::fprintf(stderr, "GLFW error (%d): %s\\n", error, description ? description : "no message");
+def _dedent(text: str) -> str:
+    return textwrap.dedent(text).strip() + "\n"
+
+
+class _FileTemplate(Template):
+    # CMake and bash both use ${...}, so placeholders are spelled @@name instead.
+    delimiter = "@@"
+
+
+def safe_write(path: str, contents: bytes, force: bool) -> None:
+    # O_EXCL makes the existence check and the create a single atomic step.
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if force else os.O_EXCL)
+    try:
+        fd = os.open(path, flags, 0o644)
+    except FileExistsError:
+        raise FileExistsError(f"{path} already exists. Use --force to overwrite.") from None
+    try:
+        view = memoryview(contents)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_files(files: list[tuple[str, bytes]], force: bool) -> None:
+    # Check every target before writing anything so a collision never leaves a half-written project.
+    if not force:
+        existing: dict[str, set[str]] = {}
+        for path, _ in files:
+            parent, name = os.path.split(path)
+            names = existing.get(parent)
+            if names is None:
+                with os.scandir(parent) as entries:
+                    names = existing[parent] = {entry.name for entry in entries}
+            if name in names:
+                raise FileExistsError(f"{path} already exists. Use --force to overwrite.")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda item: safe_write(*item, force), files))
+
+
+_CMAKELISTS_TEMPLATE = _dedent(
+    """\
+    cmake_minimum_required(VERSION 3.21)
+
+    project(@@project_name VERSION 0.1.0 LANGUAGES CXX)
+
+    set(CMAKE_CXX_STANDARD 20)
+    set(CMAKE_CXX_STANDARD_REQUIRED ON)
+    set(CMAKE_EXPORT_COMPILE_COMMANDS ON)
+
+    include(FetchContent)
+
+    if(POLICY CMP0169)
+        cmake_policy(SET CMP0169 OLD)
+    endif()
+
+    set(GLFW_BUILD_DOCS OFF CACHE INTERNAL "")
+    set(GLFW_BUILD_TESTS OFF CACHE INTERNAL "")
+    set(GLFW_BUILD_EXAMPLES OFF CACHE INTERNAL "")
+    set(GLFW_INSTALL OFF CACHE INTERNAL "")
+
+    FetchContent_Declare(
+        glfw
+        GIT_REPOSITORY https://github.com/glfw/glfw.git
+        GIT_TAG 3.4
+    )
+
+    FetchContent_Declare(
+        glm
+        GIT_REPOSITORY https://github.com/g-truc/glm.git
+        GIT_TAG 1.0.1
+    )
+    set(GLM_TEST_ENABLE OFF CACHE INTERNAL "")
+
+    FetchContent_Declare(
+        glad
+        GIT_REPOSITORY https://github.com/Dav1dde/glad.git
+        GIT_TAG v0.1.36
+        PATCH_COMMAND ${CMAKE_COMMAND} -DGLAD_SOURCE=<SOURCE_DIR> -P ${CMAKE_CURRENT_LIST_DIR}/cmake/patch_glad.cmake
+    )
+
+    set(GLAD_PROFILE \"core\" CACHE STRING \"\" FORCE)
+    set(GLAD_API \"gl=4.1\" CACHE STRING \"\" FORCE)
+    set(GLAD_GENERATOR \"c\" CACHE STRING \"\" FORCE)
+    set(GLAD_EXTENSIONS \"\" CACHE STRING \"\" FORCE)
+
+    FetchContent_Declare(
+        imgui
+        GIT_REPOSITORY https://github.com/ocornut/imgui.git
+        GIT_TAG v1.90.4
+    )
+
+    FetchContent_MakeAvailable(glfw glm glad)
+
+    FetchContent_GetProperties(imgui)
+    if(NOT imgui_POPULATED)
+        FetchContent_Populate(imgui)
+    endif()
+
+    set(IMGUI_SOURCES
+        ${imgui_SOURCE_DIR}/imgui.cpp
+        ${imgui_SOURCE_DIR}/imgui_demo.cpp
+        ${imgui_SOURCE_DIR}/imgui_draw.cpp
+        ${imgui_SOURCE_DIR}/imgui_tables.cpp
+        ${imgui_SOURCE_DIR}/imgui_widgets.cpp
+        ${imgui_SOURCE_DIR}/backends/imgui_impl_glfw.cpp
+        ${imgui_SOURCE_DIR}/backends/imgui_impl_opengl3.cpp
+    )
+
+    add_library(imgui_backend STATIC ${IMGUI_SOURCES})
+    target_include_directories(imgui_backend PUBLIC
+        ${imgui_SOURCE_DIR}
+        ${imgui_SOURCE_DIR}/backends
+    )
+    target_link_libraries(imgui_backend PUBLIC glfw glad)
+    target_compile_definitions(imgui_backend PUBLIC IMGUI_DISABLE_OBSOLETE_FUNCTIONS)
+    
+    file(GLOB_RECURSE SRC_FILES CONFIGURE_DEPENDS
+        "${CMAKE_SOURCE_DIR}/src/*.cpp"
+        "${CMAKE_SOURCE_DIR}/src/*.c"
+    )
+
+    add_executable(${PROJECT_NAME} ${SRC_FILES})
+
+    target_include_directories(${PROJECT_NAME} PRIVATE src)
+    target_link_libraries(${PROJECT_NAME} PRIVATE glfw glad imgui_backend glm::glm)
+    target_compile_definitions(${PROJECT_NAME} PRIVATE IMGUI_IMPL_OPENGL_LOADER_GLAD)
+
+    if (APPLE)
+        target_link_libraries(${PROJECT_NAME} PRIVATE "-framework Cocoa" "-framework IOKit" "-framework CoreVideo")
+    endif()
+    """
+)
+
+
+@functools.lru_cache(maxsize=32)
+def build_cmakelists(project_name: str) -> bytes:
+    return _FileTemplate(_CMAKELISTS_TEMPLATE).substitute(project_name=project_name).encode("utf-8")
+
+
+_MAIN_CPP_TEMPLATE = _dedent(
+    """\
+    #include "Application.hpp"
+
+    #include <cstdio>
+    #include <cstdlib>
+    #include <exception>
+
+    int main() {
+        try {
+            Application app("@@display_name", 1280, 720);
+            app.Run();
+        } catch (const std::exception& e) {
+            std::fprintf(stderr, "Fatal error: %s\\n", e.what());
+            return EXIT_FAILURE;
+        }
+        return EXIT_SUCCESS;
+    }
+    """
+)
+
+
+@functools.lru_cache(maxsize=32)
+def build_main_cpp(display_name: str) -> bytes:
+    return _FileTemplate(_MAIN_CPP_TEMPLATE).substitute(display_name=display_name).encode("utf-8")
+
+
+_APPLICATION_HPP_BYTES = _dedent(
+    """\
+    #pragma once
+
+    #include <string>
+
+    struct GLFWwindow;
+
+    class Application {
+    public:
+        Application(std::string title, int width, int height);
+        ~Application();
+
+        Application(const Application&) = delete;
+        Application& operator=(const Application&) = delete;
+
+        void Run();
+
+    private: // Methods
+        void Initialize();
+        void Shutdown();
+        void OnFramebufferResized(int width, int height);
+        void OnContentScaleChanged(float xScale, float yScale);
+
+    private: // Members
+        std::string m_Title;
+        int m_Width;
+        int m_Height;
+        GLFWwindow* m_Window{nullptr};
+        bool m_GlfwInitialized{false};
+        bool m_ImguiInitialized{false};
+        int m_FramebufferWidth{0};
+        int m_FramebufferHeight{0};
+        float m_ContentScaleX{1.0f};
+        float m_ContentScaleY{1.0f};
+    };
+    """
+).encode("utf-8")
+
+
+def build_application_hpp() -> bytes:
+    return _APPLICATION_HPP_BYTES
+
+
+_APPLICATION_CPP_BYTES = _dedent(
+    """\
+    #include "Application.hpp"
+
+    #include <stdexcept>
+    #include <utility>
+
+    #ifndef GLFW_INCLUDE_NONE
+    #define GLFW_INCLUDE_NONE
+    #endif
+    #include <GLFW/glfw3.h>
+    #include <glad/glad.h>
+
+    #include <imgui.h>
+    #include <imgui_impl_glfw.h>
+    #include <imgui_impl_opengl3.h>
+
+    #include <glm/glm.hpp>
+    #include <glm/gtc/type_ptr.hpp>
+
+    #include <cstdio>
+
+    namespace {
+    void glfw_error_callback(int error, const char* description) {
+        std::fprintf(stderr, "GLFW error (%d): %s\\n", error, description ? description : "no message");
+    }
+    } // namespace
+
+    Application::Application(std::string title, int width, int height)
+        : m_Title(std::move(title)),
+          m_Width(width),
+          m_Height(height),
+          m_FramebufferWidth(width),
+          m_FramebufferHeight(height) {
+        Initialize();
+    }
+
+    Application::~Application() {
+        Shutdown();
+    }
+
+    void Application::Initialize() {
+        glfwSetErrorCallback(glfw_error_callback);
+        if (!glfwInit()) {
+            throw std::runtime_error("Failed to initialize GLFW.");
         }
-        } // namespace
-
-        Application::Application(std::string title, int width, int height)
-            : m_Title(std::move(title)),
-              m_Width(width),
-              m_Height(height),
-              m_FramebufferWidth(width),
-              m_FramebufferHeight(height) {
-            Initialize();
+        m_GlfwInitialized = true;
+
+        glfwWindowHint(GLFW_CONTEXT_VERSION_MAJOR, 4);
+        glfwWindowHint(GLFW_CONTEXT_VERSION_MINOR, 1);
+        glfwWindowHint(GLFW_OPENGL_PROFILE, GLFW_OPENGL_CORE_PROFILE);
+    #if defined(__APPLE__)
+        glfwWindowHint(GLFW_OPENGL_FORWARD_COMPAT, GL_TRUE);
+    #endif
+        glfwWindowHint(GLFW_SCALE_TO_MONITOR, GLFW_TRUE);
+
+        m_Window = glfwCreateWindow(m_Width, m_Height, m_Title.c_str(), nullptr, nullptr);
+        if (!m_Window) {
+            throw std::runtime_error("Failed to create GLFW window.");
         }
 
-        Application::~Application() {
-            Shutdown();
+        glfwMakeContextCurrent(m_Window);
+        glfwSwapInterval(1);
+
+        glfwSetWindowUserPointer(m_Window, this);
+        if (!gladLoadGLLoader(reinterpret_cast<GLADloadproc>(glfwGetProcAddress))) {
+            throw std::runtime_error("Failed to initialize GLAD.");
         }
 
-        void Application::Initialize() {
-            glfwSetErrorCallback(glfw_error_callback);
-            if (!glfwInit()) {
-                throw std::runtime_error("Failed to initialize GLFW.");
-            }
-            m_GlfwInitialized = true;
-
-            glfwWindowHint(GLFW_CONTEXT_VERSION_MAJOR, 4);
-            glfwWindowHint(GLFW_CONTEXT_VERSION_MINOR, 1);
-            glfwWindowHint(GLFW_OPENGL_PROFILE, GLFW_OPENGL_CORE_PROFILE);
-        #if defined(__APPLE__)
-            glfwWindowHint(GLFW_OPENGL_FORWARD_COMPAT, GL_TRUE);
-        #endif
-            glfwWindowHint(GLFW_SCALE_TO_MONITOR, GLFW_TRUE);
-
-            m_Window = glfwCreateWindow(m_Width, m_Height, m_Title.c_str(), nullptr, nullptr);
-            if (!m_Window) {
-                throw std::runtime_error("Failed to create GLFW window.");
-            }
-
-            glfwMakeContextCurrent(m_Window);
-            glfwSwapInterval(1);
-
-            glfwSetWindowUserPointer(m_Window, this);
-            if (!gladLoadGLLoader(reinterpret_cast<GLADloadproc>(glfwGetProcAddress))) {
-                throw std::runtime_error("Failed to initialize GLAD.");
-            }
-
-            glfwSetFramebufferSizeCallback(
-                m_Window, [](GLFWwindow* window, int width, int height) {
-                    auto* app = static_cast<Application*>(glfwGetWindowUserPointer(window));
-                    if (app) {
-                        app->OnFramebufferResized(width, height);
-                    }
-                });
-            glfwSetWindowContentScaleCallback(
-                m_Window, [](GLFWwindow* window, float xScale, float yScale) {
-                    auto* app = static_cast<Application*>(glfwGetWindowUserPointer(window));
-                    if (app) {
-                        app->OnContentScaleChanged(xScale, yScale);
-                    }
-                });
-
-            int framebufferWidth = 0;
-            int framebufferHeight = 0;
-            glfwGetFramebufferSize(m_Window, &framebufferWidth, &framebufferHeight);
-            OnFramebufferResized(framebufferWidth, framebufferHeight);
-
-            float xScale = 1.0f;
-            float yScale = 1.0f;
-            glfwGetWindowContentScale(m_Window, &xScale, &yScale);
-            OnContentScaleChanged(xScale, yScale);
-
-            IMGUI_CHECKVERSION();
-            ImGui::CreateContext();
-            ImGuiIO& io = ImGui::GetIO();
-            io.ConfigFlags |= ImGuiConfigFlags_NavEnableKeyboard;
-            ImGui::StyleColorsDark();
-
-            if (!ImGui_ImplGlfw_InitForOpenGL(m_Window, true)) {
-                throw std::runtime_error("Failed to initialize Dear ImGui GLFW backend.");
-            }
-            if (!ImGui_ImplOpenGL3_Init("#version 410")) {
-                throw std::runtime_error("Failed to initialize Dear ImGui OpenGL backend.");
-            }
-
-            m_ImguiInitialized = true;
+        glfwSetFramebufferSizeCallback(
+            m_Window, [](GLFWwindow* window, int width, int height) {
+                auto* app = static_cast<Application*>(glfwGetWindowUserPointer(window));
+                if (app) {
+                    app->OnFramebufferResized(width, height);
+                }
+            });
+        glfwSetWindowContentScaleCallback(
+            m_Window, [](GLFWwindow* window, float xScale, float yScale) {
+                auto* app = static_cast<Application*>(glfwGetWindowUserPointer(window));
+                if (app) {
+                    app->OnContentScaleChanged(xScale, yScale);
+                }
+            });
+
+        int framebufferWidth = 0;
+        int framebufferHeight = 0;
+        glfwGetFramebufferSize(m_Window, &framebufferWidth, &framebufferHeight);
+        OnFramebufferResized(framebufferWidth, framebufferHeight);
+
+        float xScale = 1.0f;
+        float yScale = 1.0f;
+        glfwGetWindowContentScale(m_Window, &xScale, &yScale);
+        OnContentScaleChanged(xScale, yScale);
+
+        IMGUI_CHECKVERSION();
+        ImGui::CreateContext();
+        ImGuiIO& io = ImGui::GetIO();
+        io.ConfigFlags |= ImGuiConfigFlags_NavEnableKeyboard;
+        ImGui::StyleColorsDark();
+
+        if (!ImGui_ImplGlfw_InitForOpenGL(m_Window, true)) {
+            throw std::runtime_error("Failed to initialize Dear ImGui GLFW backend.");
+        }
+        if (!ImGui_ImplOpenGL3_Init("#version 410")) {
+            throw std::runtime_error("Failed to initialize Dear ImGui OpenGL backend.");
         }
 
-        void Application::Run() {
-            if (!m_Window) {
-                throw std::runtime_error("Application window is not available.");
-            }
+        m_ImguiInitialized = true;
+    }
+
+    void Application::Run() {
+        if (!m_Window) {
+            throw std::runtime_error("Application window is not available.");
+        }
 
-            glm::vec3 clearColor{0.10f, 0.13f, 0.17f};
+        glm::vec3 clearColor{0.10f, 0.13f, 0.17f};
 
-            while (!glfwWindowShouldClose(m_Window)) {
-                glfwPollEvents();
+        while (!glfwWindowShouldClose(m_Window)) {
+            glfwPollEvents();
 
-                ImGui_ImplOpenGL3_NewFrame();
-                ImGui_ImplGlfw_NewFrame();
-                ImGui::NewFrame();
+            ImGui_ImplOpenGL3_NewFrame();
+            ImGui_ImplGlfw_NewFrame();
+            ImGui::NewFrame();
 
-                ImGui::Begin("Hello, ImGui");
-                ImGui::Text("Welcome to %s", m_Title.c_str());
-                ImGui::ColorEdit3("Clear Color", glm::value_ptr(clearColor));
-                ImGui::Text("Renderer: %s", reinterpret_cast<const char*>(glGetString(GL_RENDERER)));
-                ImGui::Text("OpenGL: %s", reinterpret_cast<const char*>(glGetString(GL_VERSION)));
-                ImGui::End();
+            ImGui::Begin("Hello, ImGui");
+            ImGui::Text("Welcome to %s", m_Title.c_str());
+            ImGui::ColorEdit3("Clear Color", glm::value_ptr(clearColor));
+            ImGui::Text("Renderer: %s", reinterpret_cast<const char*>(glGetString(GL_RENDERER)));
+            ImGui::Text("OpenGL: %s", reinterpret_cast<const char*>(glGetString(GL_VERSION)));
+            ImGui::End();
 
-                ImGui::Render();
+            ImGui::Render();
 
-                glClearColor(clearColor.r, clearColor.g, clearColor.b, 1.0f);
-                glClear(GL_COLOR_BUFFER_BIT);
+            glClearColor(clearColor.r, clearColor.g, clearColor.b, 1.0f);
+            glClear(GL_COLOR_BUFFER_BIT);
 
-                ImGui_ImplOpenGL3_RenderDrawData(ImGui::GetDrawData());
+            ImGui_ImplOpenGL3_RenderDrawData(ImGui::GetDrawData());
 
-                glfwSwapBuffers(m_Window);
-            }
+            glfwSwapBuffers(m_Window);
         }
-
-        void Application::Shutdown() {
-            if (m_ImguiInitialized) {
-                ImGui_ImplOpenGL3_Shutdown();
-                ImGui_ImplGlfw_Shutdown();
-                ImGui::DestroyContext();
-                m_ImguiInitialized = false;
-            } else if (ImGui::GetCurrentContext()) {
-                ImGui::DestroyContext();
-            }
-
-            if (m_Window) {
-                glfwDestroyWindow(m_Window);
-                m_Window = nullptr;
-            }
-
-            if (m_GlfwInitialized) {
-                glfwTerminate();
-                m_GlfwInitialized = false;
-            }
+    }
+
+    void Application::Shutdown() {
+        if (m_ImguiInitialized) {
+            ImGui_ImplOpenGL3_Shutdown();
+            ImGui_ImplGlfw_Shutdown();
+            ImGui::DestroyContext();
+            m_ImguiInitialized = false;
+        } else if (ImGui::GetCurrentContext()) {
+            ImGui::DestroyContext();
         }
 
-        void Application::OnFramebufferResized(int width, int height) {
-            m_FramebufferWidth = width > 0 ? width : 1;
-            m_FramebufferHeight = height > 0 ? height : 1;
-            glViewport(0, 0, m_FramebufferWidth, m_FramebufferHeight);
+        if (m_Window) {
+            glfwDestroyWindow(m_Window);
+            m_Window = nullptr;
         }
 
-        void Application::OnContentScaleChanged(float xScale, float yScale) {
-            m_ContentScaleX = xScale > 0.0f ? xScale : 1.0f;
-            m_ContentScaleY = yScale > 0.0f ? yScale : 1.0f;
-
-            int framebufferWidth = 0;
-            int framebufferHeight = 0;
-            glfwGetFramebufferSize(m_Window, &framebufferWidth, &framebufferHeight);
-            OnFramebufferResized(framebufferWidth, framebufferHeight);
+        if (m_GlfwInitialized) {
+            glfwTerminate();
+            m_GlfwInitialized = false;
         }
-        """
-    ).strip() + "\n"
-
-
-def build_readme(display_name: str, slug: str) -> str:
-    return textwrap.dedent(
-        f"""\
-        # {display_name}
-
-        Generated OpenGL starter project using GLFW, GLAD, GLM, and Dear ImGui.
-
-        ## Build
-
-        ```bash
-        cmake -S . -B build
-        cmake --build build
-        ```
-
-        Or use the provided helper script:
-
-        ```bash
-        ./build.sh [Debug|Release|RelWithDebInfo|MinSizeRel] [-r|--run] 
-        ```
-
-        Flags (all optional):
-
-        - `Debug|Release|RelWithDebInfo|MinSizeRel` — choose the CMake build type (default: `Debug`)
-        - `-r`, `--run` — run the built binary after a successful build
-        ## Run
-
-        ```bash
-        ./build/{slug}
-        ```
-        """
-    ).strip() + "\n"
-
-
-def build_build_script(slug: str) -> str:
-    return textwrap.dedent(
-        f"""\
-        #!/usr/bin/env bash
-
-        set -Eeuo pipefail
-
-        trap 'echo "✖ error: ${{BASH_SOURCE[0]}}:$LINENO: ${{BASH_COMMAND}}" >&2' ERR
-
-        BUILD_DIR="${{BUILD_DIR:-build}}"
-        RUN_AFTER_BUILD=0
-        TYPE="Debug"
-        APP_PATH="${{APP_PATH:-bin/${{TYPE}}/{slug}}}"
-        FORMAT_AFTER_BUILD=0
-
-        SCRIPT_DIR="$(cd "$(dirname "${{BASH_SOURCE[0]}}")" >/dev/null 2>&1 && pwd)"
-
-        cd "$SCRIPT_DIR"
-
-        usage() {{
-          cat <<USAGE
-        Usage: ${{BASH_SOURCE[0]}} [Debug|Release|RelWithDebInfo|MinSizeRel] [-r|--run]
-
-        Arguments are optional and order-independent:
-          Debug|Release|RelWithDebInfo|MinSizeRel  Build type (default: Debug)
-          -r, --run                                Run the application after build
-          -fmt, --format                           Run ./scripts/format-all.sh before configuring
-          -h, --help                               Show this help message
-        USAGE
-        }}
-
-        while [[ $# -gt 0 ]]; do
-          case "$1" in
-          Debug | Release | RelWithDebInfo | MinSizeRel)
-            TYPE="$1"
-            ;;
-          -r | --run)
-            RUN_AFTER_BUILD=1
-            ;;
-          -h | --help)
-            usage
-            exit 0
-            ;;
-          *)
-            echo "Unknown option: $1" >&2
-            usage
-            exit 1
-            ;;
-          esac
-          shift
-        done
-
-        APP_PATH="${{APP_PATH:-bin/${{TYPE}}/{slug}}}"
-        SHOULD_RUN=$([[ $RUN_AFTER_BUILD -eq 1 ]] && echo "run" || echo "norun")
-
-        resolve_executable() {{
-          local slug="{slug}"
-          local base="$BUILD_DIR"
-          local declared="$APP_PATH"
-          local candidates=()
-
-          if [[ -n "$declared" ]]; then
-            if [[ "$declared" = /* ]]; then
-              candidates+=("$declared")
-            else
-              candidates+=("$base/$declared")
-              candidates+=("$declared")
-            fi
-          fi
-
-          candidates+=("$base/bin/${{TYPE}}/$slug" "$base/$slug" "$base/bin/$slug" "$base/${{TYPE}}/$slug")
-
-          for candidate in "${{candidates[@]}}"; do
-            [[ -n "$candidate" ]] || continue
-            if [[ -x "$candidate" ]]; then
-              echo "$candidate"
-              return 0
-            fi
-          done
-          return 1
-        }}
-
-       
-        cmake -B "$BUILD_DIR" \\
-          -DCMAKE_BUILD_TYPE="$TYPE" \\
-          -DCMAKE_EXPORT_COMPILE_COMMANDS=ON
-        cmake --build "$BUILD_DIR" --parallel
-
-        echo "Build completed."
-
-        case "$SHOULD_RUN" in
-        run)
-          if executable_path="$(resolve_executable)"; then
-            echo "Running application: $executable_path"
-            "$executable_path"
-          else
-            echo "Build finished, but executable was not found (checked $APP_PATH and common defaults)." >&2
-            exit 1
-          fi
-          ;;
-        norun)
-          echo "Done."
-          ;;
-        *)
-          echo "Build finished — unknown run command: $SHOULD_RUN"
-          exit 2
-          ;;
-        esac
-        """
-    ).strip() + "\n"
-
-
-def build_glad_patch_script() -> str:
-    return textwrap.dedent(
-        """\
-        if(NOT DEFINED GLAD_SOURCE)
-          message(FATAL_ERROR "GLAD_SOURCE not provided to patch_glad.cmake")
-        endif()
-
-        set(_glad_cmake "${GLAD_SOURCE}/CMakeLists.txt")
-        if(NOT EXISTS "${_glad_cmake}")
-          message(FATAL_ERROR "Cannot find glad CMakeLists.txt at ${_glad_cmake}")
-        endif()
-
-        file(READ "${_glad_cmake}" _glad_contents)
-        string(REPLACE "cmake_minimum_required(VERSION 3.0)" "cmake_minimum_required(VERSION 3.21)" _glad_contents "${_glad_contents}")
-        file(WRITE "${_glad_cmake}" "${_glad_contents}")
-        """
-    ).strip() + "\n"
-
-
-def build_gitignore() -> str:
-    return textwrap.dedent(
-        """\
-        # Build artifacts
-        /build/
-        /cmake-build-*/
-        /CMakeFiles/
-        /Testing/
-        CMakeCache.txt
-        CMakeScripts/
-        Makefile
-        cmake_install.cmake
-        install_manifest.txt
-        compile_commands.json
-        build.ninja
-        *.ninja
-        *.o
-        *.obj
-        *.lo
-        *.la
-        *.a
-        *.so
-        *.dylib
-        *.dll
-        *.exe
-        *.pdb
-
-        # External deps fetched by CMake
-        /_deps/
-
-        # IDE / editor metadata
-        /.idea/
-        /.vscode/
-        *.code-workspace
-
-        # Misc
-        .DS_Store
-        Thumbs.db
-        """
-    ).strip() + "\n"
-
-
-def build_ignore_file() -> str:
-    return textwrap.dedent(
-        """\
-        # Ignore bulky build output when searching (used by ripgrep / Telescope)
-        build/
-        cmake-build-*/
-        _deps/
-        """
-    ).strip() + "\n"
+    }
 
+    void Application::OnFramebufferResized(int width, int height) {
+        m_FramebufferWidth = width > 0 ? width : 1;
+        m_FramebufferHeight = height > 0 ? height : 1;
+        glViewport(0, 0, m_FramebufferWidth, m_FramebufferHeight);
+    }
 
-def parse_args() -> argparse.Namespace:
+    void Application::OnContentScaleChanged(float xScale, float yScale) {
+        m_ContentScaleX = xScale > 0.0f ? xScale : 1.0f;
+        m_ContentScaleY = yScale > 0.0f ? yScale : 1.0f;
+
+        int framebufferWidth = 0;
+        int framebufferHeight = 0;
+        glfwGetFramebufferSize(m_Window, &framebufferWidth, &framebufferHeight);
+        OnFramebufferResized(framebufferWidth, framebufferHeight);
+    }
+    """
+).encode("utf-8")
+
+
+def build_application_cpp() -> bytes:
+    return _APPLICATION_CPP_BYTES
+
+
+_README_TEMPLATE = _dedent(
+    """\
+    # @@display_name
+
+    Generated OpenGL starter project using GLFW, GLAD, GLM, and Dear ImGui.
+
+    ## Build
+
+    ```bash
+    cmake -S . -B build
+    cmake --build build
+    ```
+
+    Or use the provided helper script:
+
+    ```bash
+    ./build.sh [Debug|Release|RelWithDebInfo|MinSizeRel] [-r|--run] 
+    ```
+
+    Flags (all optional):
+
+    - `Debug|Release|RelWithDebInfo|MinSizeRel` — choose the CMake build type (default: `Debug`)
+    - `-r`, `--run` — run the built binary after a successful build
+    ## Run
+
+    ```bash
+    ./build/@@slug
+    ```
+    """
+)
+
+
+@functools.lru_cache(maxsize=32)
+def build_readme(display_name: str, slug: str) -> bytes:
+    return _FileTemplate(_README_TEMPLATE).substitute(display_name=display_name, slug=slug).encode("utf-8")
+
+
+_BUILD_SCRIPT_TEMPLATE = _dedent(
+    """\
+    #!/usr/bin/env bash
+
+    set -Eeuo pipefail
+
+    trap 'echo "✖ error: ${BASH_SOURCE[0]}:$LINENO: ${BASH_COMMAND}" >&2' ERR
+
+    BUILD_DIR="${BUILD_DIR:-build}"
+    RUN_AFTER_BUILD=0
+    TYPE="Debug"
+    APP_PATH="${APP_PATH:-bin/${TYPE}/@@slug}"
+    FORMAT_AFTER_BUILD=0
+
+    SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" >/dev/null 2>&1 && pwd)"
+
+    cd "$SCRIPT_DIR"
+
+    usage() {
+      cat <<USAGE
+    Usage: ${BASH_SOURCE[0]} [Debug|Release|RelWithDebInfo|MinSizeRel] [-r|--run]
+
+    Arguments are optional and order-independent:
+      Debug|Release|RelWithDebInfo|MinSizeRel  Build type (default: Debug)
+      -r, --run                                Run the application after build
+      -fmt, --format                           Run ./scripts/format-all.sh before configuring
+      -h, --help                               Show this help message
+    USAGE
+    }
+
+    while [[ $# -gt 0 ]]; do
+      case "$1" in
+      Debug | Release | RelWithDebInfo | MinSizeRel)
+        TYPE="$1"
+        ;;
+      -r | --run)
+        RUN_AFTER_BUILD=1
+        ;;
+      -h | --help)
+        usage
+        exit 0
+        ;;
+      *)
+        echo "Unknown option: $1" >&2
+        usage
+        exit 1
+        ;;
+      esac
+      shift
+    done
+
+    APP_PATH="${APP_PATH:-bin/${TYPE}/@@slug}"
+    SHOULD_RUN=$([[ $RUN_AFTER_BUILD -eq 1 ]] && echo "run" || echo "norun")
+
+    resolve_executable() {
+      local slug="@@slug"
+      local base="$BUILD_DIR"
+      local declared="$APP_PATH"
+      local candidates=()
+
+      if [[ -n "$declared" ]]; then
+        if [[ "$declared" = /* ]]; then
+          candidates+=("$declared")
+        else
+          candidates+=("$base/$declared" "$declared")
+        fi
+      fi
+
+      candidates+=("$base/${TYPE}/$slug" "$base/$slug")
+
+      for candidate in "${candidates[@]}"; do
+        if [[ -x "$candidate" ]]; then
+          echo "$candidate"
+          return 0
+        fi
+      done
+
+      # Fall back to searching the build tree, preferring a match for the requested build type.
+      local found
+      found="$(find "$base" -maxdepth 3 -type f -name "$slug" -perm -u+x -path "*/${TYPE}/*" -print -quit)"
+      if [[ -z "$found" ]]; then
+        found="$(find "$base" -maxdepth 3 -type f -name "$slug" -perm -u+x -print -quit)"
+      fi
+      [[ -n "$found" ]] || return 1
+      echo "$found"
+    }
+
+   
+    cmake -B "$BUILD_DIR" \\
+      -DCMAKE_BUILD_TYPE="$TYPE" \\
+      -DCMAKE_EXPORT_COMPILE_COMMANDS=ON
+    cmake --build "$BUILD_DIR" --parallel
+
+    echo "Build completed."
+
+    case "$SHOULD_RUN" in
+    run)
+      if executable_path="$(resolve_executable)"; then
+        echo "Running application: $executable_path"
+        "$executable_path"
+      else
+        echo "Build finished, but executable was not found (checked $APP_PATH, $BUILD_DIR/$TYPE/@@slug, $BUILD_DIR/@@slug and searched $BUILD_DIR)." >&2
+        exit 1
+      fi
+      ;;
+    norun)
+      echo "Done."
+      ;;
+    *)
+      echo "Build finished — unknown run command: $SHOULD_RUN"
+      exit 2
+      ;;
+    esac
+    """
+)
+
+
+@functools.lru_cache(maxsize=32)
+def build_build_script(slug: str) -> bytes:
+    return _FileTemplate(_BUILD_SCRIPT_TEMPLATE).substitute(slug=slug).encode("utf-8")
+
+
+_GLAD_PATCH_BYTES = _dedent(
+    """\
+    if(NOT DEFINED GLAD_SOURCE)
+      message(FATAL_ERROR "GLAD_SOURCE not provided to patch_glad.cmake")
+    endif()
+
+    set(_glad_cmake "${GLAD_SOURCE}/CMakeLists.txt")
+    if(NOT EXISTS "${_glad_cmake}")
+      message(FATAL_ERROR "Cannot find glad CMakeLists.txt at ${_glad_cmake}")
+    endif()
+
+    file(READ "${_glad_cmake}" _glad_contents)
+    string(REPLACE "cmake_minimum_required(VERSION 3.0)" "cmake_minimum_required(VERSION 3.21)" _glad_contents "${_glad_contents}")
+    file(WRITE "${_glad_cmake}" "${_glad_contents}")
+    """
+).encode("utf-8")
+
+
+def build_glad_patch_script() -> bytes:
+    return _GLAD_PATCH_BYTES
+
+
+_GITIGNORE_BYTES = _dedent(
+    """\
+    # Build artifacts
+    /build/
+    /cmake-build-*/
+    /CMakeFiles/
+    /Testing/
+    CMakeCache.txt
+    CMakeScripts/
+    Makefile
+    cmake_install.cmake
+    install_manifest.txt
+    compile_commands.json
+    build.ninja
+    *.ninja
+    *.o
+    *.obj
+    *.lo
+    *.la
+    *.a
+    *.so
+    *.dylib
+    *.dll
+    *.exe
+    *.pdb
+
+    # External deps fetched by CMake
+    /_deps/
+
+    # IDE / editor metadata
+    /.idea/
+    /.vscode/
+    *.code-workspace
+
+    # Misc
+    .DS_Store
+    Thumbs.db
+    """
+).encode("utf-8")
+
+
+def build_gitignore() -> bytes:
+    return _GITIGNORE_BYTES
+
+
+_IGNORE_FILE_BYTES = _dedent(
+    """\
+    # Ignore bulky build output when searching (used by ripgrep / Telescope)
+    build/
+    cmake-build-*/
+    _deps/
+    """
+).encode("utf-8")
+
+
+def build_ignore_file() -> bytes:
+    return _IGNORE_FILE_BYTES
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Create a C++ OpenGL project skeleton.")
     parser.add_argument("name", nargs="?", help="Project display name (prompts if omitted).")
     parser.add_argument("-l", "--location", help="Base directory where the project folder should be created.")
     parser.add_argument("-f", "--force", action="store_true", help="Overwrite existing files if necessary.")
-    return parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def parse_args() -> argparse.Namespace:
+    return _PARSER.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    interactive = sys.stdin.isatty()
 
-    project_display_name = args.name or input("Project name: ").strip()
+    project_display_name = args.name
+    if not project_display_name and interactive:
+        project_display_name = input("Project name: ").strip()
     if not project_display_name:
-        sys.exit("A project name is required.")
+        sys.exit("A project name is required (pass it as an argument when not running interactively).")
 
     base_dir_input = args.location
-    if not base_dir_input:
-        base_dir_input = input("Base directory (leave empty for current directory): ").strip() or "."
+    if not base_dir_input and interactive:
+        base_dir_input = input("Base directory (leave empty for current directory): ").strip()
+    base_dir_input = base_dir_input or "."
 
-    base_dir = Path(base_dir_input).expanduser().resolve()
-    if not base_dir.exists():
+    base_dir = os.path.realpath(os.path.expanduser(base_dir_input))
+    if not os.path.isdir(base_dir):
         sys.exit(f"Base directory does not exist: {base_dir}")
 
     slug = slugify(project_display_name)
-    project_dir = base_dir / slug
+    project_dir = os.path.join(base_dir, slug)
 
     try:
-        project_dir.mkdir(parents=True, exist_ok=False)
+        os.makedirs(project_dir)
     except FileExistsError:
         if not args.force:
             sys.exit(f"Project directory already exists: {project_dir} (use --force to reuse it)")
-    src_dir = project_dir / "src"
-    src_dir.mkdir(exist_ok=True)
-    cmake_dir = project_dir / "cmake"
-    cmake_dir.mkdir(exist_ok=True)
+    src_dir = os.path.join(project_dir, "src")
+    os.makedirs(src_dir, exist_ok=True)
+    cmake_dir = os.path.join(project_dir, "cmake")
+    os.makedirs(cmake_dir, exist_ok=True)
+
+    build_sh_path = os.path.join(project_dir, "build.sh")
+    files = [
+        (os.path.join(project_dir, "CMakeLists.txt"), build_cmakelists(slug)),
+        (os.path.join(src_dir, "main.cpp"), build_main_cpp(project_display_name)),
+        (os.path.join(src_dir, "Application.hpp"), build_application_hpp()),
+        (os.path.join(src_dir, "Application.cpp"), build_application_cpp()),
+        (os.path.join(project_dir, "README.md"), build_readme(project_display_name, slug)),
+        (build_sh_path, build_build_script(slug)),
+        (os.path.join(cmake_dir, "patch_glad.cmake"), build_glad_patch_script()),
+        (os.path.join(project_dir, ".gitignore"), build_gitignore()),
+        (os.path.join(project_dir, ".ignore"), build_ignore_file()),
+    ]
 
     try:
-        safe_write(project_dir / "CMakeLists.txt", build_cmakelists(slug), args.force)
-        safe_write(src_dir / "main.cpp", build_main_cpp(project_display_name), args.force)
-        safe_write(src_dir / "Application.hpp", build_application_hpp(), args.force)
-        safe_write(src_dir / "Application.cpp", build_application_cpp(), args.force)
-        safe_write(project_dir / "README.md", build_readme(project_display_name, slug), args.force)
-        build_sh_path = project_dir / "build.sh"
-        safe_write(build_sh_path, build_build_script(slug), args.force)
-        build_sh_path.chmod(0o755)
-        safe_write(cmake_dir / "patch_glad.cmake", build_glad_patch_script(), args.force)
-        safe_write(project_dir / ".gitignore", build_gitignore(), args.force)
-        safe_write(project_dir / ".ignore", build_ignore_file(), args.force)
+        write_files(files, args.force)
+        os.chmod(build_sh_path, 0o755)
     except Exception as exc:
         sys.exit(f"Failed to write project files: {exc}")
 